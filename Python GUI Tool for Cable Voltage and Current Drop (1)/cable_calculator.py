@@ -1,9 +1,11 @@
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, simpledialog
 import json
+import math
 import os
-from PIL import Image, ImageTk # For image handling
+from functools import lru_cache
+import numpy as np
 
 # Cable data (resistance per meter in Ohms/meter at 20°C)
 CABLE_DATA = {
@@ -20,39 +22,143 @@ CABLE_DATA = {
 
 # Temperature coefficient for copper (alpha at 20°C)
 ALPHA_COPPER = 0.00393
+# Constant part of the temperature correction: 1 + ALPHA_COPPER * (T - 20) == _ALPHA_K + ALPHA_COPPER * T
+_ALPHA_K = 1.0 - ALPHA_COPPER * 20.0
+
+# Returned by determine_cores_required when no number of cores can meet the requirements
+IMPOSSIBLE = math.inf
+
+# Flattened (cable_type, conductor_spec) -> resistance per meter at 20°C
+_R20 = {(ct, cs): r for ct, d in CABLE_DATA.items() for cs, r in d.items()}
+# Valid (cable_type, conductor_spec) pairs, so validation is a single membership test
+_VALID = frozenset(_R20)
+
+# Array form of the same table for batch lookups: _R20_ARR[_SPEC_INDEX[(cable_type, conductor_spec)]]
+_KEYS = list(_R20)
+_R20_ARR = np.array([_R20[k] for k in _KEYS], dtype=np.float64)
+_SPEC_INDEX = {k: i for i, k in enumerate(_KEYS)}
+
+@lru_cache(maxsize=64)
+def _r_at(cable_type, conductor_spec, temp_c):
+    """
+    Returns the resistance per meter of a conductor at temp_c, cached per (cable, spec, temperature).
+    """
+    return _R20[(cable_type, conductor_spec)] * (1 + ALPHA_COPPER * (temp_c - 20))
 
 def calculate_voltage_drop(length_m, current_a, cable_type, conductor_spec, num_cores=1, temp_c=20):
     """
     Calculates the voltage drop over a specified cable length.
 
+    length_m, current_a, num_cores and temp_c may be scalars or NumPy arrays;
+    arrays are broadcast against each other so a whole sweep is computed in one call.
+
     Args:
-        length_m (float): Length of the cable in meters.
-        current_a (float): Current flowing through the cable in Amperes.
+        length_m (float or array): Length of the cable in meters.
+        current_a (float or array): Current flowing through the cable in Amperes.
         cable_type (str): Type of cable (\'alarm\' or \'network\').
         conductor_spec (str): Conductor specification (e.g., \'18 AWG\', \'Cat5e\').
-        num_cores (int): Number of parallel cores used for current path (e.g., 2 for a single pair in network cable).
+        num_cores (int or array): Number of parallel cores used for current path (e.g., 2 for a single pair in network cable).
                          For alarm cables, this would typically be 1 per conductor, or 2 if using two conductors for a single path.
-        temp_c (float): Operating temperature in Celsius.
+        temp_c (float or array): Operating temperature in Celsius.
 
     Returns:
-        float: Calculated voltage drop in Volts.
+        float or numpy.ndarray: Calculated voltage drop in Volts (an ndarray if any input is an array).
     """
-    if cable_type not in CABLE_DATA or conductor_spec not in CABLE_DATA[cable_type]:
+    if (cable_type, conductor_spec) not in _VALID:
         raise ValueError("Invalid cable type or conductor specification.")
+    if np.any(np.asarray(num_cores) <= 0):
+        raise ValueError("Number of cores must be at least 1.")
 
-    resistance_per_meter_at_20c = CABLE_DATA[cable_type][conductor_spec]
-
-    # Adjust resistance for temperature
-    resistance_per_meter_at_temp = resistance_per_meter_at_20c * (1 + ALPHA_COPPER * (temp_c - 20))
+    # Adjust resistance for temperature (no correction at the 20°C reference; arrays of temperatures can't go through the cache)
+    if np.ndim(temp_c) == 0:
+        resistance_per_meter_at_temp = _R20[(cable_type, conductor_spec)] if temp_c == 20 else _r_at(cable_type, conductor_spec, float(temp_c))
+    else:
+        resistance_per_meter_at_temp = _R20[(cable_type, conductor_spec)] * (1.0 + ALPHA_COPPER * (np.asarray(temp_c) - 20.0))
 
     # Total resistance of the cable run (round trip for DC circuits)
     # Assuming two conductors for the current path (e.g., positive and negative)
     # If num_cores > 1, it means parallel conductors are used, reducing overall resistance
-    total_resistance = (resistance_per_meter_at_temp * length_m * 2) / num_cores
+    total_resistance = (resistance_per_meter_at_temp * np.asarray(length_m) * 2.0) / np.asarray(num_cores)
 
-    voltage_drop = current_a * total_resistance
+    voltage_drop = np.asarray(current_a) * total_resistance
+    if voltage_drop.ndim == 0:
+        return float(voltage_drop) # Keep plain floats for scalar callers (e.g. the GUI)
     return voltage_drop
 
+def _vd_sweep_numpy(R, L, I, T, n):
+    return (I * L * 2.0 / n) * R * (_ALPHA_K + ALPHA_COPPER * T)
+
+@lru_cache(maxsize=None)
+def _get_kernel():
+    """
+    Returns the batch sweep kernel, Numba-compiled if Numba is installed.
+
+    Numba is imported here rather than at module level so the GUI, which never runs
+    a batch, doesn't pay its import cost at startup.
+    """
+    try:
+        from numba import njit, prange # Optional: compiled kernel for batch sweeps
+    except ImportError:
+        return _vd_sweep_numpy
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vd_sweep(R, L, I, T, n):
+        out = np.empty(L.shape)
+        for i in prange(L.size):
+            # Written so the temperature term is a single multiply-add (FMA under fastmath)
+            out[i] = (I[i] * L[i] * 2.0 / n[i]) * R[i] * (_ALPHA_K + ALPHA_COPPER * T[i])
+        return out
+
+    return _vd_sweep
+
+def _sweep(r20, length_m, current_a, num_cores, temp_c):
+    # Broadcast everything to flat float64 arrays so the kernel only ever sees plain arrays
+    args = np.broadcast_arrays(r20, length_m, current_a, temp_c, num_cores)
+    R, L, I, T, n = (np.ascontiguousarray(a, dtype=np.float64).ravel() for a in args)
+    if np.any(n <= 0):
+        raise ValueError("Number of cores must be at least 1.")
+    return _get_kernel()(R, L, I, T, n).reshape(args[0].shape)
+
+def calculate_voltage_drop_batch(length_m, current_a, cable_type, conductor_spec, num_cores=1, temp_c=20):
+    """
+    Calculates the voltage drop for a sweep of inputs (e.g. a voltage-drop vs length curve).
+
+    Same arguments as calculate_voltage_drop; the numeric ones are broadcast together and
+    evaluated by a Numba-compiled kernel when Numba is installed, or by NumPy otherwise.
+
+    Returns:
+        numpy.ndarray: Voltage drop in Volts, shaped like the broadcast inputs.
+    """
+    if (cable_type, conductor_spec) not in _VALID:
+        raise ValueError("Invalid cable type or conductor specification.")
+
+    return _sweep(_R20[(cable_type, conductor_spec)], length_m, current_a, num_cores, temp_c)
+
+def calculate_voltage_drop_indexed(length_m, current_a, spec_index, num_cores=1, temp_c=20):
+    """
+    Calculates the voltage drop for a sweep that also varies the cable.
+
+    Like calculate_voltage_drop_batch, but the cable is given per element as an index
+    (or array of indices) into the flattened cable table; see spec_index_of().
+
+    Returns:
+        numpy.ndarray: Voltage drop in Volts, shaped like the broadcast inputs.
+    """
+    spec_index = np.asarray(spec_index)
+    # Negative indices would otherwise silently wrap around to the end of the table
+    if not np.issubdtype(spec_index.dtype, np.integer) or np.any((spec_index < 0) | (spec_index >= len(_KEYS))):
+        raise ValueError("Invalid cable specification index.")
+
+    return _sweep(_R20_ARR[spec_index], length_m, current_a, num_cores, temp_c)
+
+def spec_index_of(cable_type, conductor_spec):
+    """
+    Returns the index of a (cable_type, conductor_spec) pair for calculate_voltage_drop_indexed.
+    """
+    if (cable_type, conductor_spec) not in _VALID:
+        raise ValueError("Invalid cable type or conductor specification.")
+    return _SPEC_INDEX[(cable_type, conductor_spec)]
+
 def determine_cores_required(length_m, required_voltage, required_current, cable_type, conductor_spec, min_voltage_percent_drop=10, temp_c=20):
     """
     Determines the minimum number of cores required to maintain a specified voltage.
@@ -67,18 +173,18 @@ def determine_cores_required(length_m, required_voltage, required_current, cable
         temp_c (float): Operating temperature in Celsius.
 
     Returns:
-        int: Minimum number of cores required.
+        int: Minimum number of cores required, or IMPOSSIBLE if the requirements can't be met.
     """
-    if cable_type not in CABLE_DATA or conductor_spec not in CABLE_DATA[cable_type]:
+    if (cable_type, conductor_spec) not in _VALID:
         raise ValueError("Invalid cable type or conductor specification.")
 
-    resistance_per_meter_at_20c = CABLE_DATA[cable_type][conductor_spec]
-    resistance_per_meter_at_temp = resistance_per_meter_at_20c * (1 + ALPHA_COPPER * (temp_c - 20))
+    # No temperature correction needed at the 20°C reference
+    resistance_per_meter_at_temp = _R20[(cable_type, conductor_spec)] if temp_c == 20 else _r_at(cable_type, conductor_spec, float(temp_c))
 
     max_allowed_voltage_drop = required_voltage * (min_voltage_percent_drop / 100)
     
     if required_current == 0: # Handle division by zero if current is 0
-        return 1 if max_allowed_voltage_drop >= 0 else float('inf')
+        return 1 if max_allowed_voltage_drop >= 0 else IMPOSSIBLE
 
     max_allowed_resistance = max_allowed_voltage_drop / required_current
 
@@ -87,31 +193,56 @@ def determine_cores_required(length_m, required_voltage, required_current, cable
 
     # Determine how many parallel paths are needed to get below the max_allowed_resistance
     if max_allowed_resistance <= 0: # Avoid division by zero or negative resistance
-        return float('inf') # Indicates an impossible scenario
+        return IMPOSSIBLE # Indicates an impossible scenario
+
+    # Round up: any fractional core means the next whole core is needed to stay within the drop budget.
+    # The small relative tolerance stops float noise on an exact whole number (e.g. 7.000000000000001) adding a core.
+    cores_needed = single_path_resistance / max_allowed_resistance
+    return max(1, math.ceil(cores_needed * (1 - 1e-9)))
+
+
+# Input field keys, in display order
+_INPUT_KEYS = ("cable_type", "conductor_spec", "length", "voltage", "current", "num_cores", "temp")
+
+PRESETS_FILE = ".cable_calculator_presets.json"
+
+try:
+    import orjson # Optional: faster C JSON encoder/decoder for presets
 
-    cores_needed = (single_path_resistance / max_allowed_resistance)
-    return max(1, int(round(cores_needed)))
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data):
+        return json.dumps(data, separators=(",", ":")).encode()
 
-def save_presets(data, filename=".cable_calculator_presets.json"):
+    _loads = json.loads
+
+def save_presets(data, filename=PRESETS_FILE):
     """
     Saves the current input parameters as a preset.
+
+    Returns:
+        bool: True if the presets were written, False if saving failed.
     """
     try:
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
+        with open(filename, "wb") as f:
+            f.write(_dumps(data))
+        return True
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save preset: {e}")
+        return False
 
-def load_presets(filename=".cable_calculator_presets.json"):
+def load_presets(filename=PRESETS_FILE):
     """
     Loads presets from a file.
     """
     try:
         if not os.path.exists(filename):
             return {}
-        with open(filename, "r") as f:
-            return json.load(f)
+        with open(filename, "rb") as f:
+            return _loads(f.read())
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError:
@@ -138,9 +269,31 @@ class CableCalculatorGUI:
             # Ensure the path is correct relative to where the script is run
             script_dir = os.path.dirname(__file__)
             logo_path = os.path.join(script_dir, "INTERCOMMainLogo(1).png")
-            self.logo_image = Image.open(logo_path)
-            self.logo_image = self.logo_image.resize((200, 100), Image.LANCZOS)
-            self.logo_photo = ImageTk.PhotoImage(self.logo_image)
+            # The resized logo is kept as a PNG, which Tk 8.6 loads natively (with alpha),
+            # so later launches don't need PIL at all
+            cached_logo_path = logo_path + ".200x100.png"
+            logo_mtime = os.path.getmtime(logo_path) # Raises FileNotFoundError before PIL is imported
+            self.logo_photo = None
+            if os.path.exists(cached_logo_path) and os.path.getmtime(cached_logo_path) >= logo_mtime:
+                try:
+                    self.logo_photo = tk.PhotoImage(file=cached_logo_path)
+                except tk.TclError:
+                    try:
+                        os.remove(cached_logo_path) # Corrupt cache; rebuilt below
+                    except OSError:
+                        pass
+            if self.logo_photo is None:
+                from PIL import Image, ImageTk # For image handling; deferred so it's only needed to build the cache
+                self.logo_image = Image.open(logo_path)
+                self.logo_image = self.logo_image.resize((200, 100), Image.LANCZOS)
+                # Write to a temporary file and swap it in, so a partial write never looks like a valid cache
+                tmp_logo_path = f"{cached_logo_path}.{os.getpid()}.tmp"
+                try:
+                    self.logo_image.save(tmp_logo_path, "PNG", optimize=True)
+                    os.replace(tmp_logo_path, cached_logo_path)
+                except OSError:
+                    pass # Cache is optional, e.g. if the script directory is read-only
+                self.logo_photo = ImageTk.PhotoImage(self.logo_image)
             self.logo_label = tk.Label(master, image=self.logo_photo)
             self.logo_label.pack(pady=10)
         except FileNotFoundError:
@@ -184,13 +337,17 @@ class CableCalculatorGUI:
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=master.quit)
 
-        # Initial update of conductor spec dropdown
+        # Presets are kept in memory and only re-read when the file changes on disk
+        self._presets = None
+        self._presets_mtime = 0
+
+        # Initial population of conductor spec dropdown
         self.update_conductor_specs()
 
     def create_input_widgets(self, parent_frame):
         self.entries = {}
         labels = ["Cable Type:", "Conductor Spec:", "Length (m):", "Source Voltage (V):", "Required Current (A):", "Number of Cores:", "Temperature (°C):"]
-        keys = ["cable_type", "conductor_spec", "length", "voltage", "current", "num_cores", "temp"]
+        keys = _INPUT_KEYS
         default_values = {"num_cores": "1", "temp": "20"}
 
         for i, label_text in enumerate(labels):
@@ -203,12 +360,12 @@ class CableCalculatorGUI:
                 combo = ttk.Combobox(row, textvariable=self.cable_type_var, values=list(CABLE_DATA.keys()), state="readonly")
                 combo.pack(side="right", expand=True, fill="x")
                 combo.bind("<<ComboboxSelected>>", self.update_conductor_specs)
-                self.entries[keys[i]] = combo
+                self.entries[keys[i]] = self.cable_type_var
             elif label_text == "Conductor Spec:":
                 self.conductor_spec_var = tk.StringVar()
-                combo = ttk.Combobox(row, textvariable=self.conductor_spec_var, values=[], state="readonly")
-                combo.pack(side="right", expand=True, fill="x")
-                self.entries[keys[i]] = combo
+                self.conductor_spec_combo = ttk.Combobox(row, textvariable=self.conductor_spec_var, values=[], state="readonly", postcommand=self._populate_specs)
+                self.conductor_spec_combo.pack(side="right", expand=True, fill="x")
+                self.entries[keys[i]] = self.conductor_spec_var
             else:
                 entry_var = tk.StringVar(value=default_values.get(keys[i], ""))
                 entry = ttk.Entry(row, textvariable=entry_var)
@@ -235,23 +392,21 @@ class CableCalculatorGUI:
         
         self.results_labels["cd_result"].set("N/A (Current is assumed constant for voltage drop)")
 
+    def _populate_specs(self):
+        # Also runs as the dropdown's postcommand, so the list is always current when it is opened
+        self.conductor_spec_combo["values"] = list(CABLE_DATA.get(self.cable_type_var.get(), {}))
+
     def update_conductor_specs(self, event=None):
-        selected_cable_type = self.cable_type_var.get()
-        specs = list(CABLE_DATA.get(selected_cable_type, {}).keys())
-        self.entries["conductor_spec"]["values"] = specs
-        if specs:
-            self.entries["conductor_spec"].set(specs[0])
-        else:
-            self.entries["conductor_spec"].set("")
+        # Keep the values list in step with the cable type; mouse-wheel selection reads it without opening the dropdown
+        self._populate_specs()
+        specs = CABLE_DATA.get(self.cable_type_var.get(), {})
+        # Only touch the selection when it doesn't belong to the selected cable type
+        if self.conductor_spec_var.get() not in specs:
+            self.conductor_spec_var.set(next(iter(specs), ""))
 
     def get_input_values(self):
-        values = {}
-        for key, widget in self.entries.items():
-            if isinstance(widget, ttk.Combobox):
-                values[key] = widget.get()
-            else:
-                values[key] = widget.get()
-        return values
+        # Every entry is a StringVar, so the values can be read uniformly
+        return {key: self.entries[key].get() for key in _INPUT_KEYS}
 
     def calculate(self):
         try:
@@ -264,6 +419,10 @@ class CableCalculatorGUI:
             cable_type = input_values["cable_type"]
             conductor_spec = input_values["conductor_spec"]
 
+            # float() accepts "inf" and "nan"; reject them in one vectorized check
+            if not np.isfinite(np.array([length, voltage, current, num_cores, temp], dtype=np.float64)).all():
+                raise ValueError("non-finite input")
+
             if self.forward_mode.get():
                 # Forward Calculation
                 voltage_drop = calculate_voltage_drop(length, current, cable_type, conductor_spec, num_cores, temp)
@@ -285,9 +444,9 @@ class CableCalculatorGUI:
                 self.results_labels["cores_required"].set(f"{cores_needed}")
                 if cores_needed == 1:
                     self.results_labels["wiring_rec"].set(f"Use 1 core of {conductor_spec}")
-                elif cores_needed > 1 and cores_needed != float("inf"):
+                elif cores_needed > 1 and cores_needed is not IMPOSSIBLE:
                     self.results_labels["wiring_rec"].set(f"Use {cores_needed} parallel cores of {conductor_spec}")
-                elif cores_needed == float("inf"):
+                elif cores_needed is IMPOSSIBLE:
                     self.results_labels["wiring_rec"].set("Impossible to meet requirements with this cable.")
 
             self.results_labels["cd_result"].set("N/A (Current is assumed constant for voltage drop)")
@@ -301,38 +460,49 @@ class CableCalculatorGUI:
         for key, widget in self.entries.items():
             if key == "cable_type":
                 widget.set(list(CABLE_DATA.keys())[0])
-                self.update_conductor_specs()
             elif key == "num_cores":
                 widget.set("1")
             elif key == "temp":
                 widget.set("20")
-            elif isinstance(widget, tk.StringVar):
-                widget.set("")
+            else:
+                widget.set("") # Conductor spec is refilled by update_conductor_specs below
         self.forward_mode.set(True)
         for key in self.results_labels:
             if key == "cd_result":
                 self.results_labels[key].set("N/A (Current is assumed constant for voltage drop)")
             else:
                 self.results_labels[key].set("")
+        # Pick the default conductor spec once, after all fields are set
+        self.update_conductor_specs()
+
+    def _presets_cached(self):
+        mtime = os.path.getmtime(PRESETS_FILE) if os.path.exists(PRESETS_FILE) else 0
+        if self._presets is None or mtime != self._presets_mtime:
+            self._presets = load_presets()
+            self._presets_mtime = mtime
+        return self._presets
 
     def save_current_preset(self):
         input_values = self.get_input_values()
-        preset_name = filedialog.askstring("Save Preset", "Enter preset name:")
+        preset_name = simpledialog.askstring("Save Preset", "Enter preset name:")
         if preset_name:
-            presets = load_presets()
+            presets = self._presets_cached()
             presets[preset_name] = input_values
             presets[preset_name]["forward_mode"] = self.forward_mode.get()
-            save_presets(presets)
+            if not save_presets(presets):
+                self._presets = None # Drop the unsaved preset; re-read from disk next time
+                return
+            self._presets_mtime = os.path.getmtime(PRESETS_FILE)
             messagebox.showinfo("Preset Saved", f"Preset \'{preset_name}\' saved successfully.")
 
     def load_selected_preset(self):
-        presets = load_presets()
+        presets = self._presets_cached()
         if not presets:
             messagebox.showinfo("Load Preset", "No presets found.")
             return
 
         preset_names = list(presets.keys())
-        selected_preset_name = filedialog.askstring("Load Preset", "Select preset to load:", initialvalue=preset_names[0])
+        selected_preset_name = simpledialog.askstring("Load Preset", "Select preset to load:", initialvalue=preset_names[0])
 
         if selected_preset_name in presets:
             loaded_preset = presets[selected_preset_name]
@@ -344,7 +514,7 @@ class CableCalculatorGUI:
                     self.entries[key].set(value)
                 elif key == "forward_mode":
                     self.forward_mode.set(value)
-                elif key in self.entries and isinstance(self.entries[key], tk.StringVar):
+                elif key in self.entries:
                     self.entries[key].set(value)
             messagebox.showinfo("Preset Loaded", f"Preset \'{selected_preset_name}\' loaded successfully.")
         elif selected_preset_name is not None: # User didn't cancel
@@ -21,6 +21,9 @@ echo Checking and installing dependencies...
 :: Install Pillow for image handling
 pip install Pillow
 
+:: Install NumPy for the calculation engine
+pip install numpy
+
 echo Dependencies checked/installed. Launching GUI...
 
 python cable_calculator.py
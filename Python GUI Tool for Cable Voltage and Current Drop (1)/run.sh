@@ -17,6 +17,9 @@ echo "Checking and installing dependencies..."
 # Install Pillow for image handling
 pip3 install Pillow
 
+# Install NumPy for the calculation engine
+pip3 install numpy
+
 # Check for tkinter (Linux/Mac specific)
 python3 -c "import tkinter" 2>/dev/null
 if [ $? -ne 0 ]; then
@@ -0,0 +1,136 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import cable_calculator as cc
+
+
+class CalculateVoltageDropTests(unittest.TestCase):
+    def test_zero_cores_is_rejected(self):
+        with self.assertRaises(ValueError):
+            cc.calculate_voltage_drop(100, 1, "alarm", "18 AWG", 0)
+        with self.assertRaises(ValueError):
+            cc.calculate_voltage_drop(100, 1, "alarm", "18 AWG", np.array([1, 0]))
+        with self.assertRaises(ValueError):
+            cc.calculate_voltage_drop_batch([10.0, 20.0], 1, "alarm", "18 AWG", 0)
+        with self.assertRaises(ValueError):
+            cc.calculate_voltage_drop_indexed([10.0, 20.0], 1, 0, np.array([1, -2]))
+
+    def test_zero_dimensional_temperature_array(self):
+        expected = cc.calculate_voltage_drop(100, 1, "alarm", "18 AWG", 1, 25.0)
+        self.assertEqual(cc.calculate_voltage_drop(100, 1, "alarm", "18 AWG", 1, np.array(25.0)), expected)
+
+
+class DetermineCoresRequiredTests(unittest.TestCase):
+    def test_zero_dimensional_temperature_array(self):
+        expected = cc.determine_cores_required(100, 12, 1, "alarm", "18 AWG", 10, 25.0)
+        self.assertEqual(cc.determine_cores_required(100, 12, 1, "alarm", "18 AWG", 10, np.array(25.0)), expected)
+
+    def test_exact_whole_number_of_cores_is_not_rounded_up(self):
+        # 0.07 Ohm/m * 25 m * 2 = 3.5 Ohm against a 0.5 Ohm budget needs exactly 7 cores
+        self.assertEqual(cc.determine_cores_required(25, 5, 1, "network", "Cat6"), 7)
+        self.assertEqual(cc.determine_cores_required(50, 5, 1, "network", "Cat6"), 14)
+
+    def test_fractional_cores_round_up(self):
+        # 0.0209 * 100 * 2 = 4.18 Ohm against 1.2 Ohm -> 3.48 cores
+        self.assertEqual(cc.determine_cores_required(100, 12, 1, "alarm", "18 AWG"), 4)
+
+
+class BatchMatchesScalarTests(unittest.TestCase):
+    lengths = np.array([0.0, 12.5, 100.0])
+    currents = np.array([[0.5], [2.0]])
+    cores = 2
+    temp = 35.0
+
+    def expected(self, cable_type, conductor_spec):
+        return np.array([[cc.calculate_voltage_drop(length, current, cable_type, conductor_spec, self.cores, self.temp)
+                          for length in self.lengths] for current in self.currents[:, 0]])
+
+    def check_against_scalar(self):
+        for cable_type, conductor_spec in cc._KEYS:
+            expected = self.expected(cable_type, conductor_spec)
+            batch = cc.calculate_voltage_drop_batch(self.lengths, self.currents, cable_type, conductor_spec, self.cores, self.temp)
+            indexed = cc.calculate_voltage_drop_indexed(self.lengths, self.currents, cc.spec_index_of(cable_type, conductor_spec),
+                                                        self.cores, self.temp)
+            np.testing.assert_allclose(batch, expected, rtol=1e-12)
+            np.testing.assert_allclose(indexed, expected, rtol=1e-12)
+
+    def test_numpy_kernel(self):
+        with mock.patch.object(cc, "_get_kernel", return_value=cc._vd_sweep_numpy):
+            self.check_against_scalar()
+
+    @unittest.skipIf(importlib.util.find_spec("numba") is None, "numba not installed")
+    def test_numba_kernel(self):
+        self.assertIsNot(cc._get_kernel(), cc._vd_sweep_numpy)
+        self.check_against_scalar()
+
+    def test_indexed_with_array_of_specs(self):
+        indices = np.arange(len(cc._KEYS))
+        expected = [cc.calculate_voltage_drop(50, 1.5, cable_type, conductor_spec, 1, 20) for cable_type, conductor_spec in cc._KEYS]
+        np.testing.assert_allclose(cc.calculate_voltage_drop_indexed(50, 1.5, indices), expected, rtol=1e-12)
+
+    def test_spec_index_of_rejects_unknown_pair(self):
+        with self.assertRaises(ValueError):
+            cc.spec_index_of("alarm", "Cat6")
+
+
+class CalculateVoltageDropIndexedTests(unittest.TestCase):
+    def test_out_of_range_or_non_integer_index_is_rejected(self):
+        for bad in (-1, len(cc._KEYS), 1.0, np.array([0, -1])):
+            with self.assertRaises(ValueError):
+                cc.calculate_voltage_drop_indexed(100, 1, bad)
+
+
+class PresetCacheTests(unittest.TestCase):
+    """Drives the GUI's preset methods without a display by patching out Tk dialogs and variables."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name) # PRESETS_FILE is relative to the working directory
+        for patcher in (mock.patch.object(cc.messagebox, "showinfo"), mock.patch.object(cc.messagebox, "showerror"),
+                        mock.patch.object(cc.messagebox, "showwarning")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.gui = cc.CableCalculatorGUI.__new__(cc.CableCalculatorGUI)
+        self.gui._presets = None
+        self.gui._presets_mtime = 0
+        self.gui.entries = {key: mock.Mock() for key in cc._INPUT_KEYS}
+        for key, var in self.gui.entries.items():
+            var.get.return_value = key + "-value"
+        self.gui.forward_mode = mock.Mock()
+        self.gui.forward_mode.get.return_value = True
+        self.gui.update_conductor_specs = mock.Mock()
+
+    def save(self, name):
+        with mock.patch.object(cc.simpledialog, "askstring", return_value=name):
+            self.gui.save_current_preset()
+
+    def test_save_then_load_round_trips_through_the_file(self):
+        self.save("site A")
+        self.assertIn("site A", cc.load_presets())
+        with mock.patch.object(cc.simpledialog, "askstring", return_value="site A"):
+            self.gui.load_selected_preset()
+        self.gui.entries["length"].set.assert_called_with("length-value")
+
+    def test_external_change_invalidates_the_cache(self):
+        self.save("site A")
+        cc.save_presets({"site B": {"length": "5"}})
+        mtime = os.path.getmtime(cc.PRESETS_FILE)
+        os.utime(cc.PRESETS_FILE, (mtime + 10, mtime + 10)) # Make sure the change is visible at coarse mtime resolution
+        self.assertEqual(list(self.gui._presets_cached()), ["site B"])
+
+    def test_failed_save_is_not_offered_for_loading(self):
+        with mock.patch.object(cc, "save_presets", return_value=False):
+            self.save("never written")
+        self.assertNotIn("never written", self.gui._presets_cached())
+
+
+if __name__ == "__main__":
+    unittest.main()